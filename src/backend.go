@@ -9,12 +9,16 @@ type CooldownKey string
 
 type CooldownManager struct {
 	cooldowns map[CooldownKey]time.Time
+	failures  map[CooldownKey]int
+	now       func() time.Time
 	mu        sync.RWMutex
 }
 
 func NewCooldownManager() *CooldownManager {
 	return &CooldownManager{
 		cooldowns: make(map[CooldownKey]time.Time),
+		failures:  make(map[CooldownKey]int),
+		now:       time.Now,
 	}
 }
 
@@ -26,20 +30,60 @@ func (cm *CooldownManager) IsCoolingDown(key CooldownKey) bool {
 	cm.mu.RLock()
 	defer cm.mu.RUnlock()
 	until, exists := cm.cooldowns[key]
-	return exists && time.Now().Before(until)
+	return exists && cm.now().Before(until)
 }
 
 func (cm *CooldownManager) SetCooldown(key CooldownKey, duration time.Duration) {
 	cm.mu.Lock()
 	defer cm.mu.Unlock()
-	cm.cooldowns[key] = time.Now().Add(duration)
+	cm.cooldowns[key] = cm.now().Add(duration)
 	LogGeneral("INFO", "设置冷却: %s 直到 %v", key, cm.cooldowns[key].Format(time.RFC3339))
 }
 
+func (cm *CooldownManager) Backoff(key CooldownKey, base, limit time.Duration) time.Duration {
+	cm.mu.Lock()
+	defer cm.mu.Unlock()
+
+	now := cm.now()
+	if until, exists := cm.cooldowns[key]; exists && now.Before(until) {
+		return until.Sub(now)
+	}
+
+	n := cm.failures[key]
+	cm.failures[key] = n + 1
+
+	duration := base
+	for i := 0; i < n && duration < limit; i++ {
+		duration *= 2
+	}
+	if duration > limit {
+		duration = limit
+	}
+	cm.cooldowns[key] = now.Add(duration)
+	LogGeneral("INFO", "设置冷却: %s 直到 %v", key, cm.cooldowns[key].Format(time.RFC3339))
+	return duration
+}
+
+// Reset clears the consecutive failure count after a success. An active
+// cooldown is left to expire: the success may come from a request that was
+// already in flight when another request put the key into cooldown.
+func (cm *CooldownManager) Reset(key CooldownKey) {
+	cm.mu.RLock()
+	_, failed := cm.failures[key]
+	cm.mu.RUnlock()
+	if !failed {
+		return
+	}
+
+	cm.mu.Lock()
+	defer cm.mu.Unlock()
+	delete(cm.failures, key)
+}
+
 func (cm *CooldownManager) ClearExpired() {
 	cm.mu.Lock()
 	defer cm.mu.Unlock()
-	now := time.Now()
+	now := cm.now()
 	for key, until := range cm.cooldowns {
 		if now.After(until) {
 			delete(cm.cooldowns, key)
@@ -26,8 +26,16 @@ func TestCooldownManager_Key(t *testing.T) {
 	}
 }
 
-func TestCooldownManager_SetAndCheck(t *testing.T) {
+func newTestCooldownManager() (*CooldownManager, func(time.Duration)) {
+	now := time.Now()
 	cm := NewCooldownManager()
+	cm.now = func() time.Time { return now }
+	return cm, func(d time.Duration) { now = now.Add(d) }
+}
+
+func TestCooldownManager_SetAndCheck(t *testing.T) {
+	t.Parallel()
+	cm, advance := newTestCooldownManager()
 	key := cm.Key("backend", "model")
 
 	if cm.IsCoolingDown(key) {
@@ -40,7 +48,7 @@ func TestCooldownManager_SetAndCheck(t *testing.T) {
 		t.Error("Key should be cooling down after SetCooldown")
 	}
 
-	time.Sleep(150 * time.Millisecond)
+	advance(150 * time.Millisecond)
 
 	if cm.IsCoolingDown(key) {
 		t.Error("Key should not be cooling down after expiry")
@@ -48,14 +56,15 @@ func TestCooldownManager_SetAndCheck(t *testing.T) {
 }
 
 func TestCooldownManager_ClearExpired(t *testing.T) {
-	cm := NewCooldownManager()
+	t.Parallel()
+	cm, advance := newTestCooldownManager()
 	key1 := cm.Key("backend1", "model1")
 	key2 := cm.Key("backend2", "model2")
 
 	cm.SetCooldown(key1, 50*time.Millisecond)
 	cm.SetCooldown(key2, 500*time.Millisecond)
 
-	time.Sleep(100 * time.Millisecond)
+	advance(100 * time.Millisecond)
 	cm.ClearExpired()
 
 	if cm.IsCoolingDown(key1) {
@@ -66,7 +75,60 @@ func TestCooldownManager_ClearExpired(t *testing.T) {
 	}
 }
 
+func TestCooldownManager_Backoff(t *testing.T) {
+	cm, advance := newTestCooldownManager()
+	key := cm.Key("backend", "model")
+
+	expected := []time.Duration{time.Second, 2 * time.Second, 4 * time.Second, 5 * time.Second, 5 * time.Second}
+	for i, want := range expected {
+		if got := cm.Backoff(key, time.Second, 5*time.Second); got != want {
+			t.Errorf("failure %d: Backoff() = %v, want %v", i+1, got, want)
+		}
+		if !cm.IsCoolingDown(key) {
+			t.Errorf("failure %d: key should be cooling down after Backoff", i+1)
+		}
+		advance(want)
+	}
+
+	if got := cm.Backoff(key, time.Second, 5*time.Second); got != 5*time.Second {
+		t.Fatalf("failure %d: Backoff() = %v, want %v", len(expected)+1, got, 5*time.Second)
+	}
+	cm.Reset(key)
+	if !cm.IsCoolingDown(key) {
+		t.Error("Reset should leave an active cooldown to expire")
+	}
+	advance(5 * time.Second)
+	if got := cm.Backoff(key, time.Second, 5*time.Second); got != time.Second {
+		t.Errorf("Backoff() after Reset = %v, want %v", got, time.Second)
+	}
+}
+
+func TestCooldownManager_Backoff_SameWindow(t *testing.T) {
+	cm, advance := newTestCooldownManager()
+	key := cm.Key("backend", "model")
+
+	if got := cm.Backoff(key, time.Second, 5*time.Second); got != time.Second {
+		t.Fatalf("first failure: Backoff() = %v, want %v", got, time.Second)
+	}
+	for i := 0; i < 4; i++ {
+		advance(100 * time.Millisecond)
+		cm.Backoff(key, time.Second, 5*time.Second)
+	}
+	if got := cm.failures[key]; got != 1 {
+		t.Errorf("failures within one cooldown window = %d, want 1", got)
+	}
+
+	advance(time.Second)
+	if cm.IsCoolingDown(key) {
+		t.Fatal("Key should not be cooling down after the first window")
+	}
+	if got := cm.Backoff(key, time.Second, 5*time.Second); got != 2*time.Second {
+		t.Errorf("next failure: Backoff() = %v, want %v", got, 2*time.Second)
+	}
+}
+
 func TestCooldownManager_Concurrent(t *testing.T) {
+	t.Parallel()
 	cm := NewCooldownManager()
 	done := make(chan bool)
 
@@ -1,8 +1,11 @@
 package main
 
 import (
+	"io"
 	"os"
+	"sort"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"gopkg.in/yaml.v3"
@@ -40,9 +43,10 @@ func (m *ModelAlias) IsEnabled() bool {
 }
 
 type Fallback struct {
-	CooldownSeconds int                 `yaml:"cooldown_seconds"`
-	MaxRetries      int                 `yaml:"max_retries"`
-	AliasFallback   map[string][]string `yaml:"alias_fallback,omitempty"`
+	CooldownSeconds    int                 `yaml:"cooldown_seconds"`
+	MinCooldownSeconds int                 `yaml:"min_cooldown_seconds,omitempty"`
+	MaxRetries         int                 `yaml:"max_retries"`
+	AliasFallback      map[string][]string `yaml:"alias_fallback,omitempty"`
 }
 
 type Detection struct {
@@ -73,12 +77,45 @@ type Config struct {
 	Fallback    Fallback               `yaml:"fallback"`
 	Detection   Detection              `yaml:"detection"`
 	Logging     Logging                `yaml:"logging"`
+
+	derivedOnce sync.Once
+	derived     *derivedConfig
+}
+
+// derivedConfig holds read-only data computed from a Config. It is built once
+// per *Config, so a reload naturally rebuilds it for the new snapshot.
+type derivedConfig struct {
+	sortedRoutes map[string][]ModelRoute
+	statusRules  []statusRule
+}
+
+func (c *Config) derive() *derivedConfig {
+	c.derivedOnce.Do(func() {
+		d := &derivedConfig{sortedRoutes: make(map[string][]ModelRoute, len(c.Models))}
+		for alias, modelAlias := range c.Models {
+			if modelAlias == nil {
+				continue
+			}
+			sorted := make([]ModelRoute, len(modelAlias.Routes))
+			copy(sorted, modelAlias.Routes)
+			sort.SliceStable(sorted, func(i, j int) bool {
+				return sorted[i].Priority < sorted[j].Priority
+			})
+			d.sortedRoutes[alias] = sorted
+		}
+		d.statusRules = compileStatusRules(c.Detection.ErrorCodes)
+		c.derived = d
+	})
+	return c.derived
 }
 
+const configCheckInterval = time.Second
+
 type ConfigManager struct {
 	config     *Config
 	configPath string
 	lastMod    time.Time
+	lastCheck  atomic.Int64
 	mu         sync.RWMutex
 }
 
@@ -91,21 +128,46 @@ func NewConfigManager(path string) (*ConfigManager, error) {
 }
 
 func (cm *ConfigManager) load() error {
-	data, err := os.ReadFile(cm.configPath)
+	cfg, modTime, err := readConfigFile(cm.configPath)
 	if err != nil {
 		return err
 	}
+	cm.config = cfg
+	cm.lastMod = modTime
+	return nil
+}
+
+func readConfigFile(path string) (*Config, time.Time, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, time.Time{}, err
+	}
+	defer f.Close()
+
+	stat, err := f.Stat()
+	if err != nil {
+		return nil, time.Time{}, err
+	}
+	data, err := io.ReadAll(f)
+	if err != nil {
+		return nil, time.Time{}, err
+	}
 	var cfg Config
 	if err := yaml.Unmarshal(data, &cfg); err != nil {
-		return err
+		return nil, time.Time{}, err
 	}
-	stat, _ := os.Stat(cm.configPath)
-	cm.config = &cfg
-	cm.lastMod = stat.ModTime()
-	return nil
+	return &cfg, stat.ModTime(), nil
 }
 
 func (cm *ConfigManager) Get() *Config {
+	now := time.Now().UnixNano()
+	if now-cm.lastCheck.Load() < int64(configCheckInterval) {
+		cm.mu.RLock()
+		defer cm.mu.RUnlock()
+		return cm.config
+	}
+	cm.lastCheck.Store(now)
+
 	cm.mu.RLock()
 	stat, err := os.Stat(cm.configPath)
 	if err != nil || stat.ModTime().Equal(cm.lastMod) {
@@ -128,26 +190,21 @@ func (cm *ConfigManager) Get() *Config {
 }
 
 func (cm *ConfigManager) tryReload() error {
-	data, err := os.ReadFile(cm.configPath)
-	if err != nil {
-		return err
-	}
-	var cfg Config
-	if err := yaml.Unmarshal(data, &cfg); err != nil {
+	if err := cm.load(); err != nil {
 		return err
 	}
-	stat, _ := os.Stat(cm.configPath)
-	cm.config = &cfg
-	cm.lastMod = stat.ModTime()
 	LogGeneral("INFO", "配置重载成功")
 	return nil
 }
 
 func (cm *ConfigManager) GetBackend(name string) *Backend {
-	cfg := cm.Get()
-	for i := range cfg.Backends {
-		if cfg.Backends[i].Name == name {
-			return &cfg.Backends[i]
+	return cm.Get().GetBackend(name)
+}
+
+func (c *Config) GetBackend(name string) *Backend {
+	for i := range c.Backends {
+		if c.Backends[i].Name == name {
+			return &c.Backends[i]
 		}
 	}
 	return nil
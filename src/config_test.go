@@ -1,7 +1,10 @@
 package main
 
 import (
+	"os"
+	"path/filepath"
 	"testing"
+	"time"
 )
 
 func TestBackend_IsEnabled(t *testing.T) {
@@ -98,3 +101,32 @@ func TestConfigManager_GetBackend(t *testing.T) {
 		}
 	}
 }
+
+func TestConfigManager_Get_ThrottlesReload(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "config.yaml")
+	if err := os.WriteFile(path, []byte("listen: \":8080\"\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	cm, err := NewConfigManager(path)
+	if err != nil {
+		t.Fatalf("NewConfigManager failed: %v", err)
+	}
+	cm.Get()
+
+	if err := os.WriteFile(path, []byte("listen: \":9090\"\n"), 0644); err != nil {
+		t.Fatal(err)
+	}
+	future := time.Now().Add(time.Hour)
+	if err := os.Chtimes(path, future, future); err != nil {
+		t.Fatal(err)
+	}
+
+	if got := cm.Get().Listen; got != ":8080" {
+		t.Errorf("Listen = %q within check interval, want %q", got, ":8080")
+	}
+
+	cm.lastCheck.Store(0)
+	if got := cm.Get().Listen; got != ":9090" {
+		t.Errorf("Listen = %q after check interval, want %q", got, ":9090")
+	}
+}
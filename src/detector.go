@@ -5,19 +5,20 @@ import (
 	"strings"
 )
 
-type Detector struct {
-	configMgr *ConfigManager
-}
+type Detector struct{}
 
-func NewDetector(cfg *ConfigManager) *Detector {
-	return &Detector{configMgr: cfg}
+// statusRule matches status codes in [min, max]; "5xx" becomes [500, 599].
+type statusRule struct {
+	min, max int
 }
 
-func (d *Detector) ShouldFallback(statusCode int, body string) bool {
-	cfg := d.configMgr.Get()
+func NewDetector() *Detector {
+	return &Detector{}
+}
 
-	for _, pattern := range cfg.Detection.ErrorCodes {
-		if d.matchStatusCode(statusCode, pattern) {
+func (d *Detector) ShouldFallback(cfg *Config, statusCode int, body string) bool {
+	for _, rule := range cfg.derive().statusRules {
+		if rule.match(statusCode) {
 			return true
 		}
 	}
@@ -31,16 +32,28 @@ func (d *Detector) ShouldFallback(statusCode int, body string) bool {
 	return false
 }
 
-func (d *Detector) matchStatusCode(code int, pattern string) bool {
-	pattern = strings.TrimSpace(pattern)
-	if strings.HasSuffix(pattern, "xx") {
-		prefix := strings.TrimSuffix(pattern, "xx")
-		codePrefix := strconv.Itoa(code / 100)
-		return codePrefix == prefix
-	}
-	exact, err := strconv.Atoi(pattern)
-	if err != nil {
-		return false
+func compileStatusRules(patterns []string) []statusRule {
+	rules := make([]statusRule, 0, len(patterns))
+	for _, pattern := range patterns {
+		pattern = strings.TrimSpace(pattern)
+		if strings.HasSuffix(pattern, "xx") {
+			prefix := strings.TrimSuffix(pattern, "xx")
+			class, err := strconv.Atoi(prefix)
+			if err != nil || class < 0 || strconv.Itoa(class) != prefix {
+				continue
+			}
+			rules = append(rules, statusRule{min: class * 100, max: class*100 + 99})
+			continue
+		}
+		exact, err := strconv.Atoi(pattern)
+		if err != nil {
+			continue
+		}
+		rules = append(rules, statusRule{min: exact, max: exact})
 	}
-	return code == exact
+	return rules
+}
+
+func (r statusRule) match(code int) bool {
+	return code >= r.min && code <= r.max
 }
@@ -12,19 +12,18 @@ func (m *mockConfigForDetector) getDetection() Detection {
 	return m.detection
 }
 
-func newDetectorWithConfig(errorCodes []string, errorPatterns []string) *Detector {
+func newDetectorWithConfig(errorCodes []string, errorPatterns []string) (*Detector, *Config) {
 	cfg := &Config{
 		Detection: Detection{
 			ErrorCodes:    errorCodes,
 			ErrorPatterns: errorPatterns,
 		},
 	}
-	cm := &ConfigManager{config: cfg}
-	return NewDetector(cm)
+	return NewDetector(), cfg
 }
 
 func TestDetector_MatchStatusCode_Exact(t *testing.T) {
-	d := newDetectorWithConfig([]string{"401", "403", "500"}, nil)
+	d, cfg := newDetectorWithConfig([]string{"401", "403", "500"}, nil)
 
 	tests := []struct {
 		code     int
@@ -39,7 +38,7 @@ func TestDetector_MatchStatusCode_Exact(t *testing.T) {
 	}
 
 	for _, tt := range tests {
-		got := d.ShouldFallback(tt.code, "")
+		got := d.ShouldFallback(cfg, tt.code, "")
 		if got != tt.expected {
 			t.Errorf("ShouldFallback(%d) = %v, want %v", tt.code, got, tt.expected)
 		}
@@ -47,7 +46,7 @@ func TestDetector_MatchStatusCode_Exact(t *testing.T) {
 }
 
 func TestDetector_MatchStatusCode_Wildcard(t *testing.T) {
-	d := newDetectorWithConfig([]string{"4xx", "5xx"}, nil)
+	d, cfg := newDetectorWithConfig([]string{"4xx", "5xx"}, nil)
 
 	tests := []struct {
 		code     int
@@ -67,7 +66,7 @@ func TestDetector_MatchStatusCode_Wildcard(t *testing.T) {
 	}
 
 	for _, tt := range tests {
-		got := d.ShouldFallback(tt.code, "")
+		got := d.ShouldFallback(cfg, tt.code, "")
 		if got != tt.expected {
 			t.Errorf("ShouldFallback(%d) with 4xx/5xx = %v, want %v", tt.code, got, tt.expected)
 		}
@@ -75,7 +74,7 @@ func TestDetector_MatchStatusCode_Wildcard(t *testing.T) {
 }
 
 func TestDetector_MatchStatusCode_Mixed(t *testing.T) {
-	d := newDetectorWithConfig([]string{"401", "5xx"}, nil)
+	d, cfg := newDetectorWithConfig([]string{"401", "5xx"}, nil)
 
 	tests := []struct {
 		code     int
@@ -90,7 +89,7 @@ func TestDetector_MatchStatusCode_Mixed(t *testing.T) {
 	}
 
 	for _, tt := range tests {
-		got := d.ShouldFallback(tt.code, "")
+		got := d.ShouldFallback(cfg, tt.code, "")
 		if got != tt.expected {
 			t.Errorf("ShouldFallback(%d) with mixed = %v, want %v", tt.code, got, tt.expected)
 		}
@@ -98,7 +97,7 @@ func TestDetector_MatchStatusCode_Mixed(t *testing.T) {
 }
 
 func TestDetector_ErrorPatterns(t *testing.T) {
-	d := newDetectorWithConfig(nil, []string{"insufficient_quota", "rate_limit", "exceeded"})
+	d, cfg := newDetectorWithConfig(nil, []string{"insufficient_quota", "rate_limit", "exceeded"})
 
 	tests := []struct {
 		body     string
@@ -112,7 +111,7 @@ func TestDetector_ErrorPatterns(t *testing.T) {
 	}
 
 	for _, tt := range tests {
-		got := d.ShouldFallback(200, tt.body)
+		got := d.ShouldFallback(cfg, 200, tt.body)
 		if got != tt.expected {
 			t.Errorf("ShouldFallback(200, %q) = %v, want %v", tt.body, got, tt.expected)
 		}
@@ -120,7 +119,7 @@ func TestDetector_ErrorPatterns(t *testing.T) {
 }
 
 func TestDetector_Combined(t *testing.T) {
-	d := newDetectorWithConfig([]string{"429"}, []string{"quota"})
+	d, cfg := newDetectorWithConfig([]string{"429"}, []string{"quota"})
 
 	tests := []struct {
 		code     int
@@ -134,7 +133,7 @@ func TestDetector_Combined(t *testing.T) {
 	}
 
 	for _, tt := range tests {
-		got := d.ShouldFallback(tt.code, tt.body)
+		got := d.ShouldFallback(cfg, tt.code, tt.body)
 		if got != tt.expected {
 			t.Errorf("ShouldFallback(%d, %q) = %v, want %v", tt.code, tt.body, got, tt.expected)
 		}
@@ -142,9 +141,26 @@ func TestDetector_Combined(t *testing.T) {
 }
 
 func TestDetector_InvalidPattern(t *testing.T) {
-	d := newDetectorWithConfig([]string{"abc", "xxx", ""}, nil)
+	d, cfg := newDetectorWithConfig([]string{"abc", "xxx", ""}, nil)
 
-	if d.ShouldFallback(500, "") {
+	if d.ShouldFallback(cfg, 500, "") {
 		t.Error("Invalid patterns should not match")
 	}
 }
+
+func TestDetector_RulesFollowConfigReload(t *testing.T) {
+	d, cfg := newDetectorWithConfig([]string{"429"}, nil)
+
+	if !d.ShouldFallback(cfg, 429, "") {
+		t.Error("ShouldFallback(429) = false, want true")
+	}
+
+	cfg = &Config{Detection: Detection{ErrorCodes: []string{"5xx"}}}
+
+	if d.ShouldFallback(cfg, 429, "") {
+		t.Error("ShouldFallback(429) after reload = true, want false")
+	}
+	if !d.ShouldFallback(cfg, 503, "") {
+		t.Error("ShouldFallback(503) after reload = false, want true")
+	}
+}
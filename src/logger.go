@@ -13,7 +13,7 @@ import (
 var (
 	generalLogger  *os.File
 	logMu          sync.Mutex
-	logLevel       = "info"
+	minLogPriority = lookupLevel("INFO").priority
 	testMode       = false
 	currentLogDate string
 	currentLogSize int64
@@ -28,11 +28,27 @@ func SetTestMode(enabled bool) {
 	testMode = enabled
 }
 
-var levelPriority = map[string]int{
-	"debug": 0,
-	"info":  1,
-	"warn":  2,
-	"error": 3,
+type levelSpec struct {
+	priority int
+	tag      string
+}
+
+var levelSpecs = map[string]levelSpec{
+	"DEBUG": {0, " [DEBUG] "},
+	"INFO":  {1, " [INFO] "},
+	"WARN":  {2, " [WARN] "},
+	"ERROR": {3, " [ERROR] "},
+}
+
+func lookupLevel(level string) levelSpec {
+	if spec, ok := levelSpecs[level]; ok {
+		return spec
+	}
+	upper := strings.ToUpper(level)
+	if spec, ok := levelSpecs[upper]; ok {
+		return spec
+	}
+	return levelSpec{0, " [" + upper + "] "}
 }
 
 var sensitivePatterns = []*regexp.Regexp{
@@ -44,9 +60,9 @@ var sensitivePatterns = []*regexp.Regexp{
 
 func InitLogger(cfg *Config) error {
 	loggingConfig = &cfg.Logging
-	logLevel = strings.ToLower(cfg.Logging.Level)
-	if logLevel == "" {
-		logLevel = "info"
+	minLogPriority = lookupLevel("INFO").priority
+	if cfg.Logging.Level != "" {
+		minLogPriority = lookupLevel(cfg.Logging.Level).priority
 	}
 	maskSensitive = cfg.Logging.ShouldMaskSensitive()
 	enableMetrics = cfg.Logging.EnableMetrics
@@ -121,7 +137,8 @@ func LogGeneral(level, format string, args ...interface{}) {
 	if testMode {
 		return
 	}
-	if levelPriority[strings.ToLower(level)] < levelPriority[logLevel] {
+	spec := lookupLevel(level)
+	if spec.priority < minLogPriority {
 		return
 	}
 	logMu.Lock()
@@ -132,8 +149,8 @@ func LogGeneral(level, format string, args ...interface{}) {
 		msg = MaskSensitiveData(msg)
 	}
 
-	line := fmt.Sprintf("[%s] [%s] %s\n", time.Now().Format("2006-01-02 15:04:05"), strings.ToUpper(level), msg)
-	fmt.Print(line)
+	line := "[" + time.Now().Format("2006-01-02 15:04:05") + "]" + spec.tag + msg + "\n"
+	os.Stdout.WriteString(line)
 
 	if generalLogger != nil {
 		if loggingConfig != nil {
@@ -191,28 +208,40 @@ func WriteErrorLog(cfg *Config, reqID string, content string) error {
 }
 
 type RequestMetrics struct {
-	StartTime    time.Time
-	RequestID    string
-	ModelAlias   string
-	Attempts     int
-	TotalLatency time.Duration
-	BackendTimes map[string]time.Duration
+	StartTime        time.Time
+	RequestID        string
+	ModelAlias       string
+	Attempts         int
+	TotalLatency     time.Duration
+	FirstByteLatency time.Duration
+	StreamEvents     int
+	BackendTimes     []BackendTiming
+}
+
+type BackendTiming struct {
+	Backend  string
+	Duration time.Duration
 }
 
 func NewRequestMetrics(reqID, modelAlias string) *RequestMetrics {
 	return &RequestMetrics{
-		StartTime:    time.Now(),
-		RequestID:    reqID,
-		ModelAlias:   modelAlias,
-		BackendTimes: make(map[string]time.Duration),
+		StartTime:  time.Now(),
+		RequestID:  reqID,
+		ModelAlias: modelAlias,
 	}
 }
 
 func (m *RequestMetrics) RecordBackendTime(backend string, duration time.Duration) {
-	m.BackendTimes[backend] = duration
+	m.BackendTimes = append(m.BackendTimes, BackendTiming{Backend: backend, Duration: duration})
 	m.Attempts++
 }
 
+func (m *RequestMetrics) RecordFirstByte() {
+	if m.FirstByteLatency == 0 {
+		m.FirstByteLatency = time.Since(m.StartTime)
+	}
+}
+
 func (m *RequestMetrics) Finish(success bool, finalBackend string) {
 	if !enableMetrics || testMode {
 		return
@@ -224,12 +253,20 @@ func (m *RequestMetrics) Finish(success bool, finalBackend string) {
 		status = "失败"
 	}
 
-	var backendDetails []string
-	for backend, duration := range m.BackendTimes {
-		backendDetails = append(backendDetails, fmt.Sprintf("%s=%dms", backend, duration.Milliseconds()))
+	var backendDetails strings.Builder
+	for i, bt := range m.BackendTimes {
+		if i > 0 {
+			backendDetails.WriteString(", ")
+		}
+		fmt.Fprintf(&backendDetails, "%s=%dms", bt.Backend, bt.Duration.Milliseconds())
+	}
+
+	firstByte := ""
+	if m.FirstByteLatency > 0 {
+		firstByte = fmt.Sprintf(" 首字节耗时=%dms 数据块=%d", m.FirstByteLatency.Milliseconds(), m.StreamEvents)
 	}
 
-	LogGeneral("INFO", "[性能指标] 请求=%s 模型=%s 状态=%s 后端=%s 尝试次数=%d 总耗时=%dms 后端耗时=[%s]",
+	LogGeneral("INFO", "[性能指标] 请求=%s 模型=%s 状态=%s 后端=%s 尝试次数=%d 总耗时=%dms%s 后端耗时=[%s]",
 		m.RequestID, m.ModelAlias, status, finalBackend, m.Attempts, m.TotalLatency.Milliseconds(),
-		strings.Join(backendDetails, ", "))
+		firstByte, backendDetails.String())
 }
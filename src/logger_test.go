@@ -0,0 +1,53 @@
+package main
+
+import (
+	"testing"
+	"time"
+)
+
+func TestLogger_LookupLevel(t *testing.T) {
+	tests := []struct {
+		level    string
+		priority int
+		tag      string
+	}{
+		{"DEBUG", 0, " [DEBUG] "},
+		{"INFO", 1, " [INFO] "},
+		{"warn", 2, " [WARN] "},
+		{"Error", 3, " [ERROR] "},
+		{"trace", 0, " [TRACE] "},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.level, func(t *testing.T) {
+			got := lookupLevel(tt.level)
+			if got.priority != tt.priority || got.tag != tt.tag {
+				t.Errorf("lookupLevel(%q) = {%d %q}, want {%d %q}", tt.level, got.priority, got.tag, tt.priority, tt.tag)
+			}
+		})
+	}
+}
+
+func TestRequestMetrics_RecordBackendTime(t *testing.T) {
+	m := NewRequestMetrics("req", "model-a")
+	m.RecordBackendTime("backend1", 10*time.Millisecond)
+	m.RecordBackendTime("backend2", 20*time.Millisecond)
+	m.RecordBackendTime("backend1", 30*time.Millisecond)
+
+	if m.Attempts != 3 {
+		t.Errorf("Attempts = %d, want 3", m.Attempts)
+	}
+	expected := []BackendTiming{
+		{"backend1", 10 * time.Millisecond},
+		{"backend2", 20 * time.Millisecond},
+		{"backend1", 30 * time.Millisecond},
+	}
+	if len(m.BackendTimes) != len(expected) {
+		t.Fatalf("BackendTimes has %d entries, want %d", len(m.BackendTimes), len(expected))
+	}
+	for i, want := range expected {
+		if m.BackendTimes[i] != want {
+			t.Errorf("BackendTimes[%d] = %v, want %v", i, m.BackendTimes[i], want)
+		}
+	}
+}
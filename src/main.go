@@ -1,9 +1,13 @@
 package main
 
 import (
+	"context"
 	"flag"
 	"log"
 	"net/http"
+	"os"
+	"os/signal"
+	"syscall"
 	"time"
 )
 
@@ -21,21 +25,52 @@ func main() {
 		log.Fatalf("初始化日志失败: %v", err)
 	}
 
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	defer stop()
+
 	cooldown := NewCooldownManager()
 	go func() {
+		ticker := time.NewTicker(time.Minute)
+		defer ticker.Stop()
 		for {
-			time.Sleep(time.Minute)
-			cooldown.ClearExpired()
+			select {
+			case <-ctx.Done():
+				return
+			case <-ticker.C:
+				cooldown.ClearExpired()
+			}
 		}
 	}()
-	router := NewRouter(configMgr, cooldown)
-	detector := NewDetector(configMgr)
+	router := NewRouter(cooldown)
+	detector := NewDetector()
 	proxy := NewProxy(configMgr, router, cooldown, detector)
 
 	LogGeneral("INFO", "LLM Proxy 启动，监听地址: %s", cfg.Listen)
 	LogGeneral("INFO", "已加载 %d 个后端，%d 个模型别名", len(cfg.Backends), len(cfg.Models))
 
-	if err := http.ListenAndServe(cfg.Listen, proxy); err != nil {
+	server := &http.Server{Addr: cfg.Listen, Handler: proxy}
+	shutdownDone := make(chan struct{})
+	var shutdownErr error
+	go func() {
+		defer close(shutdownDone)
+		<-ctx.Done()
+		stop()
+		LogGeneral("INFO", "收到退出信号，正在关闭服务器 (再次发送信号可强制退出)")
+		shutdownCtx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+		defer cancel()
+		if shutdownErr = server.Shutdown(shutdownCtx); shutdownErr != nil {
+			LogGeneral("ERROR", "服务器关闭失败: %v", shutdownErr)
+		}
+	}()
+
+	if err := server.ListenAndServe(); err != http.ErrServerClosed {
 		log.Fatalf("服务器启动失败: %v", err)
 	}
+	<-shutdownDone
+	if shutdownErr == nil {
+		proxy.Close()
+	} else {
+		LogGeneral("WARN", "仍有请求未结束, 跳过等待日志写入")
+	}
+	LogGeneral("INFO", "LLM Proxy 已退出")
 }
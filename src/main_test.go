@@ -9,3 +9,17 @@ func TestMain(m *testing.M) {
 	SetTestMode(true)
 	os.Exit(m.Run())
 }
+
+func boolPtr(b bool) *bool {
+	return &b
+}
+
+func newTestConfigManager(cfg *Config) *ConfigManager {
+	return &ConfigManager{config: cfg}
+}
+
+func newTestProxy(cfg *Config) *Proxy {
+	cm := newTestConfigManager(cfg)
+	cd := NewCooldownManager()
+	return NewProxy(cm, NewRouter(cd), cd, NewDetector())
+}
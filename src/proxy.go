@@ -5,29 +5,76 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"net/url"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/google/uuid"
 )
 
+const (
+	maxErrorBodyBytes   = 1 << 20
+	maxBodyPreallocSize = 1 << 20
+)
+
 type Proxy struct {
 	configMgr *ConfigManager
 	router    *Router
 	cooldown  *CooldownManager
 	detector  *Detector
+	client    *http.Client
+	logWG     sync.WaitGroup
+
+	modelsMu   sync.Mutex
+	modelsCfg  *Config
+	modelsBody []byte
 }
 
 func NewProxy(cfg *ConfigManager, router *Router, cd *CooldownManager, det *Detector) *Proxy {
-	return &Proxy{configMgr: cfg, router: router, cooldown: cd, detector: det}
+	return &Proxy{configMgr: cfg, router: router, cooldown: cd, detector: det, client: newHTTPClient()}
+}
+
+func newHTTPClient() *http.Client {
+	transport := &http.Transport{
+		Proxy: http.ProxyFromEnvironment,
+		DialContext: (&net.Dialer{
+			Timeout:   10 * time.Second,
+			KeepAlive: 30 * time.Second,
+		}).DialContext,
+		TLSHandshakeTimeout: 10 * time.Second,
+		ForceAttemptHTTP2:   true,
+		MaxIdleConns:        100,
+		MaxIdleConnsPerHost: 16,
+		IdleConnTimeout:     90 * time.Second,
+	}
+	return &http.Client{Timeout: 5 * time.Minute, Transport: transport}
+}
+
+// Close waits for pending log writes. Call it only after the server has shut
+// down cleanly, otherwise a still-running handler may race the wait.
+func (p *Proxy) Close() {
+	p.logWG.Wait()
+	p.client.CloseIdleConnections()
+}
+
+// writeLogAsync starts at most two writes per request, each lasting one file
+// write, so the goroutine count stays proportional to in-flight requests.
+func (p *Proxy) writeLogAsync(write func(*Config, string, string) error, cfg *Config, reqID, content string) {
+	p.logWG.Add(1)
+	go func() {
+		defer p.logWG.Done()
+		if err := write(cfg, reqID, content); err != nil {
+			LogGeneral("ERROR", "[%s] 写入日志失败: %v", reqID, err)
+		}
+	}()
 }
 
 func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	if r.URL.Path == "/health" || r.URL.Path == "/healthz" {
-		w.WriteHeader(http.StatusOK)
-		w.Write([]byte("ok"))
+		p.handleHealth(w, r)
 		return
 	}
 
@@ -50,7 +97,7 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 
 	reqID := time.Now().Format("2006-01-02_15-04-05") + "_" + uuid.New().String()[:8]
 
-	body, err := io.ReadAll(r.Body)
+	body, err := readRequestBody(r)
 	if err != nil {
 		LogGeneral("ERROR", "[%s] 读取请求体失败: %v", reqID, err)
 		http.Error(w, "读取请求体失败", http.StatusBadRequest)
@@ -58,10 +105,11 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	}
 	r.Body = io.NopCloser(bytes.NewReader(body))
 
-	var reqBody map[string]interface{}
+	var reqBody map[string]json.RawMessage
 	json.Unmarshal(body, &reqBody)
 
-	modelAlias, _ := reqBody["model"].(string)
+	var modelAlias string
+	json.Unmarshal(reqBody["model"], &modelAlias)
 	if modelAlias == "" {
 		LogGeneral("WARN", "[%s] 请求缺少 model 字段", reqID)
 		http.Error(w, "缺少 model 字段", http.StatusBadRequest)
@@ -70,7 +118,7 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 
 	LogGeneral("INFO", "[%s] 收到请求: 模型=%s 客户端=%s", reqID, modelAlias, r.RemoteAddr)
 
-	routes, _ := p.router.Resolve(modelAlias)
+	routes, _ := p.router.Resolve(cfg, modelAlias)
 	if len(routes) == 0 {
 		LogGeneral("WARN", "[%s] 未知的模型别名: %s", reqID, modelAlias)
 		http.Error(w, fmt.Sprintf("未知的模型别名: %s", modelAlias), http.StatusBadRequest)
@@ -79,20 +127,19 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 
 	LogGeneral("DEBUG", "[%s] 解析到 %d 个可用路由", reqID, len(routes))
 
-	isStream := false
-	if s, ok := reqBody["stream"].(bool); ok {
-		isStream = s
-	}
+	var isStream bool
+	json.Unmarshal(reqBody["stream"], &isStream)
 
 	var logBuilder strings.Builder
-	logBuilder.WriteString(fmt.Sprintf("================== 请求日志 ==================\n"))
-	logBuilder.WriteString(fmt.Sprintf("请求ID: %s\n时间: %s\n客户端: %s\n\n", reqID, time.Now().Format(time.RFC3339), r.RemoteAddr))
+	logBuilder.Grow(len(body) + 1024)
+	logBuilder.WriteString("================== 请求日志 ==================\n")
+	fmt.Fprintf(&logBuilder, "请求ID: %s\n时间: %s\n客户端: %s\n\n", reqID, time.Now().Format(time.RFC3339), r.RemoteAddr)
 	logBuilder.WriteString("--- 请求头 ---\n")
 	for k, v := range r.Header {
-		logBuilder.WriteString(fmt.Sprintf("%s: %s\n", k, strings.Join(v, ", ")))
+		fmt.Fprintf(&logBuilder, "%s: %s\n", k, strings.Join(v, ", "))
 	}
 	logBuilder.WriteString("\n--- 请求体 ---\n")
-	logBuilder.WriteString(string(body))
+	logBuilder.Write(body)
 	logBuilder.WriteString("\n")
 
 	var lastErr error
@@ -106,28 +153,28 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 
 	metrics := NewRequestMetrics(reqID, modelAlias)
 	var finalBackend string
+	bodyCache := make(map[string][]byte)
 
 	for i, route := range routes {
 		if i >= maxRetries {
 			break
 		}
 
-		logBuilder.WriteString(fmt.Sprintf("\n--- 尝试 %d ---\n", i+1))
-		logBuilder.WriteString(fmt.Sprintf("后端: %s\n模型: %s\n", route.BackendName, route.Model))
+		fmt.Fprintf(&logBuilder, "\n--- 尝试 %d ---\n", i+1)
+		fmt.Fprintf(&logBuilder, "后端: %s\n模型: %s\n", route.BackendName, route.Model)
 		LogGeneral("DEBUG", "[%s] 尝试后端 %s (模型: %s)", reqID, route.BackendName, route.Model)
 
-		modifiedBody := make(map[string]interface{})
-		for k, v := range reqBody {
-			modifiedBody[k] = v
+		newBody, cached := bodyCache[route.Model]
+		if !cached {
+			reqBody["model"], _ = json.Marshal(route.Model)
+			newBody, _ = marshalBody(reqBody)
+			bodyCache[route.Model] = newBody
 		}
-		modifiedBody["model"] = route.Model
-
-		newBody, _ := json.Marshal(modifiedBody)
 
 		targetURL, err := url.Parse(route.BackendURL)
 		if err != nil {
 			lastErr = err
-			logBuilder.WriteString(fmt.Sprintf("解析后端URL失败: %v\n", err))
+			fmt.Fprintf(&logBuilder, "解析后端URL失败: %v\n", err)
 			LogGeneral("ERROR", "[%s] 解析后端URL失败: %v", reqID, err)
 			continue
 		}
@@ -141,84 +188,92 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 		}
 		targetURL.RawQuery = r.URL.RawQuery
 
-		logBuilder.WriteString(fmt.Sprintf("目标URL: %s\n", targetURL.String()))
+		fmt.Fprintf(&logBuilder, "目标URL: %s\n", targetURL.String())
 
-		proxyReq, _ := http.NewRequest(r.Method, targetURL.String(), bytes.NewReader(newBody))
+		proxyReq, _ := http.NewRequestWithContext(r.Context(), r.Method, targetURL.String(), bytes.NewReader(newBody))
 		for k, v := range r.Header {
 			proxyReq.Header[k] = v
 		}
-		proxyReq.Header.Set("Content-Length", fmt.Sprintf("%d", len(newBody)))
 
-		backend := p.configMgr.GetBackend(route.BackendName)
-		if backend != nil && backend.APIKey != "" {
-			proxyReq.Header.Set("Authorization", "Bearer "+backend.APIKey)
+		if route.BackendAPIKey != "" {
+			proxyReq.Header.Set("Authorization", "Bearer "+route.BackendAPIKey)
 		}
 
-		client := &http.Client{Timeout: 5 * time.Minute}
 		backendStart := time.Now()
-		resp, err := client.Do(proxyReq)
+		resp, err := p.client.Do(proxyReq)
 		backendDuration := time.Since(backendStart)
 		metrics.RecordBackendTime(route.BackendName, backendDuration)
 
+		if err != nil && r.Context().Err() != nil {
+			fmt.Fprintf(&logBuilder, "客户端已断开: %v\n", r.Context().Err())
+			LogGeneral("INFO", "[%s] 客户端已断开，停止请求后端", reqID)
+			p.writeLogAsync(WriteRequestLog, cfg, reqID, logBuilder.String())
+			metrics.Finish(false, route.BackendName)
+			return
+		}
+
 		if err != nil {
 			lastErr = err
-			logBuilder.WriteString(fmt.Sprintf("请求失败: %v\n", err))
+			fmt.Fprintf(&logBuilder, "请求失败: %v\n", err)
 			LogGeneral("WARN", "[%s] 后端 %s 请求失败: %v", reqID, route.BackendName, err)
-			key := p.cooldown.Key(route.BackendName, route.Model)
-			p.cooldown.SetCooldown(key, time.Duration(cfg.Fallback.CooldownSeconds)*time.Second)
+			p.coolDown(cfg, p.cooldown.Key(route.BackendName, route.Model))
 			continue
 		}
 
 		if resp.StatusCode >= 200 && resp.StatusCode < 300 {
-			logBuilder.WriteString(fmt.Sprintf("状态: %d 成功\n", resp.StatusCode))
+			fmt.Fprintf(&logBuilder, "状态: %d 成功\n", resp.StatusCode)
 			LogGeneral("INFO", "[%s] 请求成功: 后端=%s 状态=%d 耗时=%dms", reqID, route.BackendName, resp.StatusCode, backendDuration.Milliseconds())
-			WriteRequestLog(cfg, reqID, logBuilder.String())
+			p.writeLogAsync(WriteRequestLog, cfg, reqID, logBuilder.String())
 
 			finalBackend = route.BackendName
-			metrics.Finish(true, finalBackend)
+			p.cooldown.Reset(p.cooldown.Key(route.BackendName, route.Model))
 
 			for k, v := range resp.Header {
 				w.Header()[k] = v
 			}
 			w.WriteHeader(resp.StatusCode)
 
-			if isStream {
-				p.streamResponse(w, resp.Body)
+			if isStream || strings.HasPrefix(resp.Header.Get("Content-Type"), "text/event-stream") {
+				p.streamResponse(w, resp.Body, metrics)
 			} else {
 				io.Copy(w, resp.Body)
 			}
 			resp.Body.Close()
+			metrics.Finish(true, finalBackend)
 			return
 		}
 
-		respBody, _ := io.ReadAll(resp.Body)
-		resp.Body.Close()
+		respBody, _ := io.ReadAll(io.LimitReader(resp.Body, maxErrorBodyBytes))
 		lastStatus = resp.StatusCode
 		lastBody = string(respBody)
 
-		logBuilder.WriteString(fmt.Sprintf("状态: %d\n响应: %s\n", resp.StatusCode, lastBody))
+		fmt.Fprintf(&logBuilder, "状态: %d\n响应: %s\n", resp.StatusCode, lastBody)
 		LogGeneral("WARN", "[%s] 后端 %s 返回错误: 状态=%d", reqID, route.BackendName, resp.StatusCode)
 
-		if p.detector.ShouldFallback(resp.StatusCode, lastBody) {
+		if p.detector.ShouldFallback(cfg, resp.StatusCode, lastBody) {
+			resp.Body.Close()
 			key := p.cooldown.Key(route.BackendName, route.Model)
-			p.cooldown.SetCooldown(key, time.Duration(cfg.Fallback.CooldownSeconds)*time.Second)
-			logBuilder.WriteString(fmt.Sprintf("操作: 冷却 %s，尝试下一个后端\n", key))
+			p.coolDown(cfg, key)
+			fmt.Fprintf(&logBuilder, "操作: 冷却 %s，尝试下一个后端\n", key)
 			LogGeneral("INFO", "[%s] 触发回退: %s 进入冷却", reqID, key)
 			continue
 		}
 
-		WriteRequestLog(cfg, reqID, logBuilder.String())
+		p.writeLogAsync(WriteRequestLog, cfg, reqID, logBuilder.String())
 		finalBackend = route.BackendName
 		metrics.Finish(false, finalBackend)
 		w.WriteHeader(resp.StatusCode)
 		w.Write(respBody)
+		io.Copy(w, resp.Body)
+		resp.Body.Close()
 		return
 	}
 
 	logBuilder.WriteString("\n--- 最终结果 ---\n所有后端均失败\n")
 	LogGeneral("ERROR", "[%s] 所有后端均失败", reqID)
-	WriteRequestLog(cfg, reqID, logBuilder.String())
-	WriteErrorLog(cfg, reqID, logBuilder.String())
+	logContent := logBuilder.String()
+	p.writeLogAsync(WriteRequestLog, cfg, reqID, logContent)
+	p.writeLogAsync(WriteErrorLog, cfg, reqID, logContent)
 
 	metrics.Finish(false, "")
 
@@ -230,7 +285,39 @@ func (p *Proxy) ServeHTTP(w http.ResponseWriter, r *http.Request) {
 	w.Write([]byte(lastBody))
 }
 
-func (p *Proxy) streamResponse(w http.ResponseWriter, body io.ReadCloser) {
+func (p *Proxy) coolDown(cfg *Config, key CooldownKey) {
+	limit := time.Duration(cfg.Fallback.CooldownSeconds) * time.Second
+	base := time.Duration(cfg.Fallback.MinCooldownSeconds) * time.Second
+	if base <= 0 || base >= limit {
+		p.cooldown.SetCooldown(key, limit)
+		return
+	}
+	p.cooldown.Backoff(key, base, limit)
+}
+
+func readRequestBody(r *http.Request) ([]byte, error) {
+	size := r.ContentLength
+	if size <= 0 || size > maxBodyPreallocSize {
+		return io.ReadAll(r.Body)
+	}
+	body := make([]byte, size)
+	if _, err := io.ReadFull(r.Body, body); err != nil {
+		return nil, err
+	}
+	return body, nil
+}
+
+func marshalBody(v interface{}) ([]byte, error) {
+	var buf bytes.Buffer
+	enc := json.NewEncoder(&buf)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(v); err != nil {
+		return nil, err
+	}
+	return bytes.TrimSuffix(buf.Bytes(), []byte("\n")), nil
+}
+
+func (p *Proxy) streamResponse(w http.ResponseWriter, body io.ReadCloser, metrics *RequestMetrics) {
 	flusher, ok := w.(http.Flusher)
 	if !ok {
 		io.Copy(w, body)
@@ -238,10 +325,18 @@ func (p *Proxy) streamResponse(w http.ResponseWriter, body io.ReadCloser) {
 	}
 
 	buf := make([]byte, 4096)
+	tail := []byte{'\n'}
 	for {
 		n, err := body.Read(buf)
 		if n > 0 {
-			w.Write(buf[:n])
+			metrics.RecordFirstByte()
+			var events int
+			events, tail = countSSEData(tail, buf[:n])
+			metrics.StreamEvents += events
+			if _, werr := w.Write(buf[:n]); werr != nil {
+				LogGeneral("INFO", "[%s] 客户端已断开，停止转发流: %v", metrics.RequestID, werr)
+				return
+			}
 			flusher.Flush()
 		}
 		if err != nil {
@@ -250,10 +345,53 @@ func (p *Proxy) streamResponse(w http.ResponseWriter, body io.ReadCloser) {
 	}
 }
 
+var sseDataLine = []byte("\ndata:")
+
+// countSSEData counts "data:" lines in chunk. tail holds the last bytes of the
+// previous chunk so that a match split across reads is still counted once.
+func countSSEData(tail, chunk []byte) (int, []byte) {
+	keep := len(sseDataLine) - 1
+	head := chunk
+	if len(head) > keep {
+		head = head[:keep]
+	}
+	window := append(append(make([]byte, 0, len(tail)+len(head)), tail...), head...)
+	count := bytes.Count(window, sseDataLine) + bytes.Count(chunk, sseDataLine)
+
+	if len(chunk) >= keep {
+		return count, append(tail[:0], chunk[len(chunk)-keep:]...)
+	}
+	if len(window) > keep {
+		window = window[len(window)-keep:]
+	}
+	return count, window
+}
+
+func (p *Proxy) handleHealth(w http.ResponseWriter, r *http.Request) {
+	w.Header().Set("Content-Type", "text/plain; charset=utf-8")
+	w.Header().Set("Content-Length", "2")
+	w.Header().Set("Cache-Control", "no-store")
+	w.WriteHeader(http.StatusOK)
+	if r.Method != http.MethodHead {
+		w.Write([]byte("ok"))
+	}
+}
+
 func (p *Proxy) handleModels(w http.ResponseWriter, r *http.Request) {
 	cfg := p.configMgr.Get()
 	LogGeneral("DEBUG", "收到模型列表请求: 客户端=%s", r.RemoteAddr)
 
+	w.Header().Set("Content-Type", "application/json")
+	w.Write(p.modelsResponse(cfg))
+}
+
+func (p *Proxy) modelsResponse(cfg *Config) []byte {
+	p.modelsMu.Lock()
+	defer p.modelsMu.Unlock()
+	if p.modelsCfg == cfg {
+		return p.modelsBody
+	}
+
 	type Model struct {
 		ID      string `json:"id"`
 		Object  string `json:"object"`
@@ -266,6 +404,7 @@ func (p *Proxy) handleModels(w http.ResponseWriter, r *http.Request) {
 		Data   []Model `json:"data"`
 	}
 
+	created := time.Now().Unix()
 	var models []Model
 	for alias, modelAlias := range cfg.Models {
 		if modelAlias == nil || !modelAlias.IsEnabled() {
@@ -274,13 +413,14 @@ func (p *Proxy) handleModels(w http.ResponseWriter, r *http.Request) {
 		models = append(models, Model{
 			ID:      alias,
 			Object:  "model",
-			Created: time.Now().Unix(),
+			Created: created,
 			OwnedBy: "llm-proxy",
 		})
 	}
 
-	LogGeneral("DEBUG", "返回 %d 个可用模型", len(models))
-	resp := Response{Object: "list", Data: models}
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	LogGeneral("DEBUG", "模型列表已更新: %d 个可用模型", len(models))
+	body, _ := json.Marshal(Response{Object: "list", Data: models})
+	p.modelsCfg = cfg
+	p.modelsBody = append(body, '\n')
+	return p.modelsBody
 }
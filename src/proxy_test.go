@@ -1,20 +1,44 @@
 package main
 
 import (
+	"context"
 	"encoding/json"
+	"fmt"
+	"net"
 	"net/http"
 	"net/http/httptest"
+	"os"
+	"path/filepath"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 )
 
+// unreachableBackendURL refuses every connection. Port 0 is never bound, so
+// unlike a closed test server's port it cannot be reused by a parallel test.
+const unreachableBackendURL = "http://127.0.0.1:0"
+
+func singleBackendConfig(backendURL string) *Config {
+	return &Config{
+		Backends: []Backend{
+			{Name: "backend1", URL: backendURL},
+		},
+		Models: map[string]*ModelAlias{
+			"model-a": {
+				Routes: []ModelRoute{
+					{Backend: "backend1", Model: "m1", Priority: 1},
+				},
+			},
+		},
+	}
+}
+
 func TestProxy_HealthEndpoint(t *testing.T) {
+	t.Parallel()
 	cfg := &Config{}
-	cm := newTestConfigManager(cfg)
-	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
-	detector := NewDetector(cm)
-	proxy := NewProxy(cm, router, cd, detector)
+	proxy := newTestProxy(cfg)
 
 	tests := []struct {
 		path string
@@ -24,52 +48,59 @@ func TestProxy_HealthEndpoint(t *testing.T) {
 	}
 
 	for _, tt := range tests {
-		req := httptest.NewRequest("GET", tt.path, nil)
-		w := httptest.NewRecorder()
+		t.Run(tt.path, func(t *testing.T) {
+			t.Parallel()
+			req := httptest.NewRequest("GET", tt.path, nil)
+			w := httptest.NewRecorder()
 
-		proxy.ServeHTTP(w, req)
+			proxy.ServeHTTP(w, req)
 
-		if w.Code != http.StatusOK {
-			t.Errorf("%s: expected 200, got %d", tt.path, w.Code)
-		}
-		if w.Body.String() != "ok" {
-			t.Errorf("%s: expected 'ok', got %q", tt.path, w.Body.String())
-		}
+			if w.Code != http.StatusOK {
+				t.Errorf("%s: expected 200, got %d", tt.path, w.Code)
+			}
+			if w.Body.String() != "ok" {
+				t.Errorf("%s: expected 'ok', got %q", tt.path, w.Body.String())
+			}
+
+			req = httptest.NewRequest("HEAD", tt.path, nil)
+			w = httptest.NewRecorder()
+
+			proxy.ServeHTTP(w, req)
+
+			if w.Code != http.StatusOK {
+				t.Errorf("HEAD %s: expected 200, got %d", tt.path, w.Code)
+			}
+			if w.Body.Len() != 0 {
+				t.Errorf("HEAD %s: expected empty body, got %q", tt.path, w.Body.String())
+			}
+			if got := w.Header().Get("Content-Length"); got != "2" {
+				t.Errorf("HEAD %s: expected Content-Length 2, got %q", tt.path, got)
+			}
+		})
 	}
 }
 
 func TestProxy_APIKeyValidation(t *testing.T) {
-	cfg := &Config{
-		ProxyAPIKey: "sk-test-key",
-		Backends: []Backend{
-			{Name: "backend1", URL: "http://backend1.com"},
-		},
-		Models: map[string]*ModelAlias{
-			"model-a": {
-				Routes: []ModelRoute{
-					{Backend: "backend1", Model: "m1", Priority: 1},
-				},
-			},
-		},
-	}
-	cm := newTestConfigManager(cfg)
-	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
-	detector := NewDetector(cm)
-	proxy := NewProxy(cm, router, cd, detector)
-
+	t.Parallel()
 	tests := []struct {
-		name       string
-		authHeader string
-		wantCode   int
+		name        string
+		proxyAPIKey string
+		authHeader  string
+		wantCode    int
 	}{
-		{"no auth", "", http.StatusUnauthorized},
-		{"wrong key", "Bearer wrong-key", http.StatusUnauthorized},
-		{"correct key", "Bearer sk-test-key", http.StatusBadGateway},
+		{"no auth", "sk-test-key", "", http.StatusUnauthorized},
+		{"wrong key", "sk-test-key", "Bearer wrong-key", http.StatusUnauthorized},
+		{"correct key", "sk-test-key", "Bearer sk-test-key", http.StatusBadGateway},
+		{"no key configured", "", "", http.StatusBadGateway},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			cfg := singleBackendConfig(unreachableBackendURL)
+			cfg.ProxyAPIKey = tt.proxyAPIKey
+			proxy := newTestProxy(cfg)
+
 			body := `{"model": "model-a"}`
 			req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
 			if tt.authHeader != "" {
@@ -86,44 +117,10 @@ func TestProxy_APIKeyValidation(t *testing.T) {
 	}
 }
 
-func TestProxy_APIKeyValidation_NoKeyConfigured(t *testing.T) {
-	cfg := &Config{
-		ProxyAPIKey: "",
-		Backends: []Backend{
-			{Name: "backend1", URL: "http://backend1.com"},
-		},
-		Models: map[string]*ModelAlias{
-			"model-a": {
-				Routes: []ModelRoute{
-					{Backend: "backend1", Model: "m1", Priority: 1},
-				},
-			},
-		},
-	}
-	cm := newTestConfigManager(cfg)
-	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
-	detector := NewDetector(cm)
-	proxy := NewProxy(cm, router, cd, detector)
-
-	body := `{"model": "model-a"}`
-	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
-	w := httptest.NewRecorder()
-
-	proxy.ServeHTTP(w, req)
-
-	if w.Code == http.StatusUnauthorized {
-		t.Error("Should not require auth when proxy_api_key is empty")
-	}
-}
-
 func TestProxy_MissingModel(t *testing.T) {
+	t.Parallel()
 	cfg := &Config{}
-	cm := newTestConfigManager(cfg)
-	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
-	detector := NewDetector(cm)
-	proxy := NewProxy(cm, router, cd, detector)
+	proxy := newTestProxy(cfg)
 
 	body := `{}`
 	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
@@ -137,14 +134,11 @@ func TestProxy_MissingModel(t *testing.T) {
 }
 
 func TestProxy_UnknownModel(t *testing.T) {
+	t.Parallel()
 	cfg := &Config{
 		Models: map[string]*ModelAlias{},
 	}
-	cm := newTestConfigManager(cfg)
-	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
-	detector := NewDetector(cm)
-	proxy := NewProxy(cm, router, cd, detector)
+	proxy := newTestProxy(cfg)
 
 	body := `{"model": "unknown-model"}`
 	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
@@ -158,6 +152,7 @@ func TestProxy_UnknownModel(t *testing.T) {
 }
 
 func TestProxy_ModelsEndpoint(t *testing.T) {
+	t.Parallel()
 	cfg := &Config{
 		Models: map[string]*ModelAlias{
 			"model-a": {Routes: []ModelRoute{{Backend: "b", Model: "m", Priority: 1}}},
@@ -165,37 +160,511 @@ func TestProxy_ModelsEndpoint(t *testing.T) {
 			"model-c": {Enabled: boolPtr(false), Routes: []ModelRoute{{Backend: "b", Model: "m", Priority: 1}}},
 		},
 	}
-	cm := newTestConfigManager(cfg)
-	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
-	detector := NewDetector(cm)
-	proxy := NewProxy(cm, router, cd, detector)
+	proxy := newTestProxy(cfg)
 
 	paths := []string{"/v1/models", "/models"}
 	for _, path := range paths {
-		req := httptest.NewRequest("GET", path, nil)
+		t.Run(path, func(t *testing.T) {
+			t.Parallel()
+			req := httptest.NewRequest("GET", path, nil)
+			w := httptest.NewRecorder()
+
+			proxy.ServeHTTP(w, req)
+
+			if w.Code != http.StatusOK {
+				t.Errorf("%s: expected 200, got %d", path, w.Code)
+			}
+
+			var resp struct {
+				Object string `json:"object"`
+				Data   []struct {
+					ID string `json:"id"`
+				} `json:"data"`
+			}
+			json.Unmarshal(w.Body.Bytes(), &resp)
+
+			if resp.Object != "list" {
+				t.Errorf("expected object 'list', got %q", resp.Object)
+			}
+
+			if len(resp.Data) != 2 {
+				t.Errorf("expected 2 models (disabled excluded), got %d", len(resp.Data))
+			}
+		})
+	}
+}
+
+func TestProxy_ModelsEndpoint_CachedPerConfig(t *testing.T) {
+	t.Parallel()
+	cfg := &Config{
+		Models: map[string]*ModelAlias{
+			"model-a": {Routes: []ModelRoute{{Backend: "b", Model: "m", Priority: 1}}},
+		},
+	}
+	proxy := newTestProxy(cfg)
+
+	get := func() string {
+		req := httptest.NewRequest("GET", "/v1/models", nil)
+		w := httptest.NewRecorder()
+		proxy.ServeHTTP(w, req)
+		return w.Body.String()
+	}
+
+	first := get()
+	if second := get(); second != first {
+		t.Errorf("expected cached response %q, got %q", first, second)
+	}
+
+	proxy.configMgr.config = &Config{
+		Models: map[string]*ModelAlias{
+			"model-b": {Routes: []ModelRoute{{Backend: "b", Model: "m", Priority: 1}}},
+		},
+	}
+	if reloaded := get(); !strings.Contains(reloaded, "model-b") || strings.Contains(reloaded, "model-a") {
+		t.Errorf("expected response rebuilt after config change, got %q", reloaded)
+	}
+}
+
+func TestProxy_ReusesBackendConnections(t *testing.T) {
+	t.Parallel()
+	var newConns int32
+	backend := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte(`{"ok":true}`))
+	}))
+	backend.Config.ConnState = func(c net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			atomic.AddInt32(&newConns, 1)
+		}
+	}
+	backend.Start()
+	defer backend.Close()
+
+	cfg := singleBackendConfig(backend.URL)
+	proxy := newTestProxy(cfg)
+
+	for i := 0; i < 3; i++ {
+		req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(`{"model": "model-a"}`))
 		w := httptest.NewRecorder()
 
 		proxy.ServeHTTP(w, req)
 
 		if w.Code != http.StatusOK {
-			t.Errorf("%s: expected 200, got %d", path, w.Code)
+			t.Fatalf("request %d: expected 200, got %d", i, w.Code)
+		}
+	}
+
+	if got := atomic.LoadInt32(&newConns); got != 1 {
+		t.Errorf("expected 1 backend connection, got %d", got)
+	}
+}
+
+func TestProxy_StreamResponse(t *testing.T) {
+	t.Parallel()
+	chunks := []string{"data: {\"n\":1}\n\n", "data: {\"n\":2}\n\n", "data: [DONE]\n\n"}
+	backend := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "text/event-stream")
+		flusher := w.(http.Flusher)
+		for _, c := range chunks {
+			w.Write([]byte(c))
+			flusher.Flush()
 		}
+	}))
+	t.Cleanup(backend.Close)
+
+	cfg := singleBackendConfig(backend.URL)
+	proxy := newTestProxy(cfg)
+
+	bodies := map[string]string{
+		"stream flag":       `{"model": "model-a", "stream": true}`,
+		"event-stream only": `{"model": "model-a"}`,
+	}
+	for name, body := range bodies {
+		t.Run(name, func(t *testing.T) {
+			t.Parallel()
+			req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
+			w := httptest.NewRecorder()
+
+			proxy.ServeHTTP(w, req)
 
-		var resp struct {
-			Object string `json:"object"`
-			Data   []struct {
-				ID string `json:"id"`
-			} `json:"data"`
+			if w.Code != http.StatusOK {
+				t.Fatalf("expected 200, got %d", w.Code)
+			}
+			if got, want := w.Body.String(), strings.Join(chunks, ""); got != want {
+				t.Errorf("expected body %q, got %q", want, got)
+			}
+			if !w.Flushed {
+				t.Error("expected streamed response to be flushed")
+			}
+		})
+	}
+}
+
+func TestProxy_FallbackRewritesModel(t *testing.T) {
+	t.Parallel()
+	var received []string
+	newBackend := func(status int) *httptest.Server {
+		return httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			var body struct {
+				Model string `json:"model"`
+			}
+			json.NewDecoder(r.Body).Decode(&body)
+			received = append(received, body.Model)
+			w.WriteHeader(status)
+		}))
+	}
+	failing := newBackend(http.StatusInternalServerError)
+	defer failing.Close()
+	healthy := newBackend(http.StatusOK)
+	defer healthy.Close()
+
+	cfg := &Config{
+		Backends: []Backend{
+			{Name: "failing", URL: failing.URL},
+			{Name: "healthy", URL: healthy.URL},
+		},
+		Models: map[string]*ModelAlias{
+			"model-a": {
+				Routes: []ModelRoute{
+					{Backend: "failing", Model: "m1", Priority: 1},
+					{Backend: "healthy", Model: "m2", Priority: 2},
+				},
+			},
+		},
+		Detection: Detection{ErrorCodes: []string{"5xx"}},
+	}
+	proxy := newTestProxy(cfg)
+
+	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(`{"model": "model-a"}`))
+	w := httptest.NewRecorder()
+
+	proxy.ServeHTTP(w, req)
+
+	if w.Code != http.StatusOK {
+		t.Fatalf("expected 200, got %d", w.Code)
+	}
+	if len(received) != 2 || received[0] != "m1" || received[1] != "m2" {
+		t.Errorf("expected backends to receive [m1 m2], got %v", received)
+	}
+}
+
+func TestProxy_PreservesRequestFields(t *testing.T) {
+	t.Parallel()
+	var received map[string]json.RawMessage
+	backend := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		json.NewDecoder(r.Body).Decode(&received)
+	}))
+	defer backend.Close()
+
+	cfg := singleBackendConfig(backend.URL)
+	proxy := newTestProxy(cfg)
+
+	body := `{"model": "model-a", "messages": [{"role": "user", "content": "<b>hi</b> & bye"}], "temperature": 0.50}`
+	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
+	w := httptest.NewRecorder()
+
+	proxy.ServeHTTP(w, req)
+
+	expected := map[string]string{
+		"model":       `"m1"`,
+		"messages":    `[{"role":"user","content":"<b>hi</b> & bye"}]`,
+		"temperature": `0.50`,
+	}
+	for field, want := range expected {
+		if got := string(received[field]); got != want {
+			t.Errorf("%s: expected %s, got %s", field, want, got)
 		}
-		json.Unmarshal(w.Body.Bytes(), &resp)
+	}
+}
+
+func TestProxy_UsesOneConfigSnapshot(t *testing.T) {
+	t.Parallel()
+	var proxy *Proxy
+	failing := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		proxy.configMgr.mu.Lock()
+		proxy.configMgr.config = &Config{}
+		proxy.configMgr.mu.Unlock()
+		w.WriteHeader(http.StatusInternalServerError)
+	}))
+	defer failing.Close()
+
+	var gotAuth string
+	healthy := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		gotAuth = r.Header.Get("Authorization")
+		w.Write([]byte(`{"ok":true}`))
+	}))
+	defer healthy.Close()
+
+	cfg := &Config{
+		ProxyAPIKey: "sk-proxy",
+		Backends: []Backend{
+			{Name: "backend1", URL: failing.URL},
+			{Name: "backend2", URL: healthy.URL, APIKey: "sk-backend2"},
+		},
+		Models: map[string]*ModelAlias{
+			"model-a": {
+				Routes: []ModelRoute{
+					{Backend: "backend1", Model: "m1", Priority: 1},
+					{Backend: "backend2", Model: "m2", Priority: 2},
+				},
+			},
+		},
+		Detection: Detection{ErrorCodes: []string{"5xx"}},
+	}
+	proxy = newTestProxy(cfg)
+
+	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(`{"model": "model-a"}`))
+	req.Header.Set("Authorization", "Bearer sk-proxy")
+	w := httptest.NewRecorder()
 
-		if resp.Object != "list" {
-			t.Errorf("expected object 'list', got %q", resp.Object)
+	proxy.ServeHTTP(w, req)
+
+	if w.Code != http.StatusOK {
+		t.Fatalf("expected fallback to backend2 after a mid-request reload, got %d", w.Code)
+	}
+	if gotAuth != "Bearer sk-backend2" {
+		t.Errorf("expected backend2's API key, got %q", gotAuth)
+	}
+}
+
+func TestProxy_CooldownBackoffSurvivesLateSuccess(t *testing.T) {
+	t.Parallel()
+	arrived := make(chan struct{})
+	release := make(chan struct{})
+	var hits int32
+	flaky := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if atomic.AddInt32(&hits, 1) == 1 {
+			close(arrived)
+			<-release
+			w.Write([]byte(`{"ok":true}`))
+			return
 		}
+		w.WriteHeader(http.StatusTooManyRequests)
+	}))
+	defer flaky.Close()
+	healthy := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte(`{"ok":true}`))
+	}))
+	defer healthy.Close()
+	releaseFlaky := sync.OnceFunc(func() { close(release) })
+	defer releaseFlaky()
+
+	configYAML := fmt.Sprintf(`backends:
+  - name: flaky
+    url: %s
+  - name: healthy
+    url: %s
+models:
+  model-a:
+    routes:
+      - backend: flaky
+        model: m1
+        priority: 1
+      - backend: healthy
+        model: m2
+        priority: 2
+fallback:
+  cooldown_seconds: 60
+  min_cooldown_seconds: 5
+detection:
+  error_codes: ["429"]
+`, flaky.URL, healthy.URL)
+	path := filepath.Join(t.TempDir(), "config.yaml")
+	if err := os.WriteFile(path, []byte(configYAML), 0644); err != nil {
+		t.Fatal(err)
+	}
+	cm, err := NewConfigManager(path)
+	if err != nil {
+		t.Fatalf("NewConfigManager failed: %v", err)
+	}
+	cd := NewCooldownManager()
+	proxy := NewProxy(cm, NewRouter(cd), cd, NewDetector())
+
+	send := func() int {
+		req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(`{"model": "model-a"}`))
+		w := httptest.NewRecorder()
+		proxy.ServeHTTP(w, req)
+		return w.Code
+	}
+
+	inFlight := make(chan int, 1)
+	go func() { inFlight <- send() }()
+	<-arrived
+
+	if code := send(); code != http.StatusOK {
+		t.Fatalf("expected fallback to healthy backend, got %d", code)
+	}
+	key := cd.Key("flaky", "m1")
+	cd.mu.RLock()
+	remaining := time.Until(cd.cooldowns[key])
+	cd.mu.RUnlock()
+	if remaining <= 0 || remaining > 5*time.Second {
+		t.Fatalf("expected a min_cooldown_seconds cooldown of at most 5s, got %v", remaining)
+	}
+
+	releaseFlaky()
+	if code := <-inFlight; code != http.StatusOK {
+		t.Fatalf("expected in-flight request to succeed, got %d", code)
+	}
+	if !cd.IsCoolingDown(key) {
+		t.Error("a success that started before the failure should not clear the cooldown")
+	}
+	cd.mu.RLock()
+	_, failed := cd.failures[key]
+	cd.mu.RUnlock()
+	if failed {
+		t.Error("expected the success to reset the failure count")
+	}
+}
+
+func TestProxy_CloseWaitsForLogWrites(t *testing.T) {
+	dir := t.TempDir()
+	general, err := os.Create(filepath.Join(dir, "general.log"))
+	if err != nil {
+		t.Fatal(err)
+	}
+	defer general.Close()
+
+	SetTestMode(false)
+	separateFiles = true
+	generalLogger = general
+	defer func() {
+		SetTestMode(true)
+		separateFiles = false
+		generalLogger = nil
+	}()
+
+	cfg := &Config{Logging: Logging{RequestDir: dir, ErrorDir: filepath.Join(dir, "missing")}}
+	proxy := newTestProxy(cfg)
+
+	release := make(chan struct{})
+	proxy.writeLogAsync(func(cfg *Config, reqID, content string) error {
+		<-release
+		return WriteRequestLog(cfg, reqID, content)
+	}, cfg, "req-ok", "request log")
+	proxy.writeLogAsync(WriteErrorLog, cfg, "req-fail", "error log")
+
+	closed := make(chan struct{})
+	go func() {
+		proxy.Close()
+		close(closed)
+	}()
+	select {
+	case <-closed:
+		t.Fatal("Close returned before the pending log write finished")
+	case <-time.After(50 * time.Millisecond):
+	}
+	close(release)
+	<-closed
+
+	if _, err := os.Stat(filepath.Join(dir, "req-ok.log")); err != nil {
+		t.Errorf("expected request log after Close: %v", err)
+	}
+	logged, _ := os.ReadFile(general.Name())
+	if !strings.Contains(string(logged), "[req-fail] 写入日志失败") {
+		t.Errorf("expected write error in general log, got %q", logged)
+	}
+}
+
+func TestProxy_LargeErrorBodyPassthrough(t *testing.T) {
+	t.Parallel()
+	errBody := strings.Repeat("x", maxErrorBodyBytes+1024)
+	backend := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.WriteHeader(http.StatusBadRequest)
+		w.Write([]byte(errBody))
+	}))
+	defer backend.Close()
+
+	cfg := singleBackendConfig(backend.URL)
+	proxy := newTestProxy(cfg)
+
+	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(`{"model": "model-a"}`))
+	w := httptest.NewRecorder()
+
+	proxy.ServeHTTP(w, req)
+
+	if w.Code != http.StatusBadRequest {
+		t.Fatalf("expected 400, got %d", w.Code)
+	}
+	if w.Body.Len() != len(errBody) {
+		t.Errorf("expected %d body bytes, got %d", len(errBody), w.Body.Len())
+	}
+}
+
+func TestProxy_ClientCanceled_NoCooldown(t *testing.T) {
+	t.Parallel()
+	backend := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte(`{"ok":true}`))
+	}))
+	defer backend.Close()
+
+	cfg := singleBackendConfig(backend.URL)
+	cfg.Fallback.CooldownSeconds = 60
+	proxy := newTestProxy(cfg)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(`{"model": "model-a"}`)).WithContext(ctx)
+	w := httptest.NewRecorder()
+
+	proxy.ServeHTTP(w, req)
+
+	if proxy.cooldown.IsCoolingDown(proxy.cooldown.Key("backend1", "m1")) {
+		t.Error("client cancellation should not put the backend into cooldown")
+	}
+}
+
+func TestReadRequestBody(t *testing.T) {
+	body := `{"model": "model-a"}`
+	tests := []struct {
+		name          string
+		contentLength int64
+		wantErr       bool
+	}{
+		{"exact length", int64(len(body)), false},
+		{"unknown length", -1, false},
+		{"oversized length", maxBodyPreallocSize + 1, false},
+		{"truncated body", int64(len(body)) + 10, true},
+	}
 
-		if len(resp.Data) != 2 {
-			t.Errorf("expected 2 models (disabled excluded), got %d", len(resp.Data))
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest("POST", "/v1/chat/completions", strings.NewReader(body))
+			req.ContentLength = tt.contentLength
+
+			got, err := readRequestBody(req)
+			if tt.wantErr {
+				if err == nil {
+					t.Error("expected error for truncated body")
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
+			if string(got) != body {
+				t.Errorf("expected %q, got %q", body, got)
+			}
+		})
+	}
+}
+
+func TestCountSSEData(t *testing.T) {
+	stream := "data: {\"n\":1}\n\ndata: {\"text\":\"data: x\"}\n\n: ping\n\ndata: [DONE]\n\n"
+
+	for _, size := range []int{1, 2, 3, 5, 7, 16, len(stream)} {
+		tail := []byte{'\n'}
+		total := 0
+		for i := 0; i < len(stream); i += size {
+			end := i + size
+			if end > len(stream) {
+				end = len(stream)
+			}
+			var n int
+			n, tail = countSSEData(tail, []byte(stream[i:end]))
+			total += n
+		}
+		if total != 3 {
+			t.Errorf("chunk size %d: expected 3 data lines, got %d", size, total)
 		}
 	}
 }
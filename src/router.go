@@ -1,56 +1,46 @@
 package main
 
-import (
-	"math/rand"
-	"sort"
-	"time"
-)
+import "math/rand"
 
 type Router struct {
-	configMgr *ConfigManager
-	cooldown  *CooldownManager
+	cooldown *CooldownManager
 }
 
-func NewRouter(cfg *ConfigManager, cd *CooldownManager) *Router {
-	return &Router{configMgr: cfg, cooldown: cd}
+func NewRouter(cd *CooldownManager) *Router {
+	return &Router{cooldown: cd}
 }
 
 type ResolvedRoute struct {
-	BackendName string
-	BackendURL  string
-	Model       string
+	BackendName   string
+	BackendURL    string
+	BackendAPIKey string
+	Model         string
 }
 
-func (r *Router) Resolve(alias string) ([]ResolvedRoute, error) {
-	return r.resolveWithVisited(alias, make(map[string]bool))
+func (r *Router) Resolve(cfg *Config, alias string) ([]ResolvedRoute, error) {
+	return r.resolveWithVisited(cfg, alias, make(map[string]bool))
 }
 
-func (r *Router) resolveWithVisited(alias string, visited map[string]bool) ([]ResolvedRoute, error) {
+func (r *Router) resolveWithVisited(cfg *Config, alias string, visited map[string]bool) ([]ResolvedRoute, error) {
 	if visited[alias] {
 		LogGeneral("WARN", "检测到循环回退: 别名=%s", alias)
 		return nil, nil
 	}
 	visited[alias] = true
 
-	cfg := r.configMgr.Get()
 	var result []ResolvedRoute
 
 	modelAlias, exists := cfg.Models[alias]
 	if exists && modelAlias != nil && modelAlias.IsEnabled() {
-		sorted := make([]ModelRoute, len(modelAlias.Routes))
-		copy(sorted, modelAlias.Routes)
-		sort.Slice(sorted, func(i, j int) bool {
-			return sorted[i].Priority < sorted[j].Priority
-		})
+		sorted := append([]ModelRoute(nil), cfg.derive().sortedRoutes[alias]...)
 
-		rng := rand.New(rand.NewSource(time.Now().UnixNano()))
 		for i := 0; i < len(sorted); {
 			j := i + 1
 			for j < len(sorted) && sorted[j].Priority == sorted[i].Priority {
 				j++
 			}
 			if j-i > 1 {
-				rng.Shuffle(j-i, func(a, b int) {
+				rand.Shuffle(j-i, func(a, b int) {
 					sorted[i+a], sorted[i+b] = sorted[i+b], sorted[i+a]
 				})
 			}
@@ -66,7 +56,7 @@ func (r *Router) resolveWithVisited(alias string, visited map[string]bool) ([]Re
 				LogGeneral("DEBUG", "跳过冷却中的后端: %s", key)
 				continue
 			}
-			backend := r.configMgr.GetBackend(route.Backend)
+			backend := cfg.GetBackend(route.Backend)
 			if backend == nil {
 				LogGeneral("WARN", "后端不存在: %s", route.Backend)
 				continue
@@ -76,21 +66,21 @@ func (r *Router) resolveWithVisited(alias string, visited map[string]bool) ([]Re
 				continue
 			}
 			result = append(result, ResolvedRoute{
-				BackendName: backend.Name,
-				BackendURL:  backend.URL,
-				Model:       route.Model,
+				BackendName:   backend.Name,
+				BackendURL:    backend.URL,
+				BackendAPIKey: backend.APIKey,
+				Model:         route.Model,
 			})
 		}
 	}
 
-	fallbackRoutes := r.collectFallbackRoutes(alias, visited)
+	fallbackRoutes := r.collectFallbackRoutes(cfg, alias, visited)
 	result = append(result, fallbackRoutes...)
 
 	return result, nil
 }
 
-func (r *Router) collectFallbackRoutes(alias string, visited map[string]bool) []ResolvedRoute {
-	cfg := r.configMgr.Get()
+func (r *Router) collectFallbackRoutes(cfg *Config, alias string, visited map[string]bool) []ResolvedRoute {
 	fallbacks, exists := cfg.Fallback.AliasFallback[alias]
 	if !exists || len(fallbacks) == 0 {
 		return nil
@@ -98,7 +88,7 @@ func (r *Router) collectFallbackRoutes(alias string, visited map[string]bool) []
 
 	var result []ResolvedRoute
 	for _, fallbackAlias := range fallbacks {
-		routes, _ := r.resolveWithVisited(fallbackAlias, visited)
+		routes, _ := r.resolveWithVisited(cfg, fallbackAlias, visited)
 		if len(routes) > 0 {
 			LogGeneral("DEBUG", "添加回退路由: %s -> %s", alias, fallbackAlias)
 			result = append(result, routes...)
@@ -5,14 +5,6 @@ import (
 	"time"
 )
 
-func boolPtr(b bool) *bool {
-	return &b
-}
-
-func newTestConfigManager(cfg *Config) *ConfigManager {
-	return &ConfigManager{config: cfg}
-}
-
 func TestRouter_Resolve_Basic(t *testing.T) {
 	cfg := &Config{
 		Backends: []Backend{
@@ -29,11 +21,10 @@ func TestRouter_Resolve_Basic(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, err := router.Resolve("model-a")
+	routes, err := router.Resolve(cfg, "model-a")
 	if err != nil {
 		t.Fatalf("Resolve failed: %v", err)
 	}
@@ -56,11 +47,10 @@ func TestRouter_Resolve_UnknownAlias(t *testing.T) {
 		Models:   map[string]*ModelAlias{},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("unknown")
+	routes, _ := router.Resolve(cfg, "unknown")
 	if len(routes) != 0 {
 		t.Errorf("Unknown alias should return empty routes, got %d", len(routes))
 	}
@@ -82,11 +72,10 @@ func TestRouter_Resolve_DisabledBackend(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("model-a")
+	routes, _ := router.Resolve(cfg, "model-a")
 	if len(routes) != 1 {
 		t.Fatalf("Expected 1 route (disabled backend skipped), got %d", len(routes))
 	}
@@ -111,11 +100,10 @@ func TestRouter_Resolve_DisabledRoute(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("model-a")
+	routes, _ := router.Resolve(cfg, "model-a")
 	if len(routes) != 1 {
 		t.Fatalf("Expected 1 route (disabled route skipped), got %d", len(routes))
 	}
@@ -139,11 +127,10 @@ func TestRouter_Resolve_DisabledAlias(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("model-a")
+	routes, _ := router.Resolve(cfg, "model-a")
 	if len(routes) != 0 {
 		t.Errorf("Disabled alias should return empty routes, got %d", len(routes))
 	}
@@ -165,14 +152,13 @@ func TestRouter_Resolve_CoolingDown(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
 	key := cd.Key("backend1", "m1")
 	cd.SetCooldown(key, time.Hour)
 
-	routes, _ := router.Resolve("model-a")
+	routes, _ := router.Resolve(cfg, "model-a")
 	if len(routes) != 1 {
 		t.Fatalf("Expected 1 route (cooling down skipped), got %d", len(routes))
 	}
@@ -206,11 +192,10 @@ func TestRouter_Resolve_AliasFallback(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("primary")
+	routes, _ := router.Resolve(cfg, "primary")
 	if len(routes) != 2 {
 		t.Fatalf("Expected 2 routes (primary + fallback), got %d", len(routes))
 	}
@@ -247,11 +232,10 @@ func TestRouter_Resolve_CircularFallback(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("alias-a")
+	routes, _ := router.Resolve(cfg, "alias-a")
 	if len(routes) != 2 {
 		t.Fatalf("Expected 2 routes (circular should be detected), got %d", len(routes))
 	}
@@ -275,11 +259,10 @@ func TestRouter_Resolve_PriorityOrder(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("model-a")
+	routes, _ := router.Resolve(cfg, "model-a")
 	if len(routes) != 3 {
 		t.Fatalf("Expected 3 routes, got %d", len(routes))
 	}
@@ -313,13 +296,12 @@ func TestRouter_Resolve_LoadBalancing(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
 	counts := make(map[string]int)
 	for i := 0; i < 100; i++ {
-		routes, _ := router.Resolve("model-a")
+		routes, _ := router.Resolve(cfg, "model-a")
 		if len(routes) > 0 {
 			counts[routes[0].BackendName]++
 		}
@@ -330,6 +312,48 @@ func TestRouter_Resolve_LoadBalancing(t *testing.T) {
 	}
 }
 
+func TestRouter_Resolve_ConfigReload(t *testing.T) {
+	cfg := &Config{
+		Backends: []Backend{
+			{Name: "backend1", URL: "http://backend1.com"},
+			{Name: "backend2", URL: "http://backend2.com"},
+		},
+		Models: map[string]*ModelAlias{
+			"model-a": {
+				Routes: []ModelRoute{
+					{Backend: "backend1", Model: "m1", Priority: 1},
+					{Backend: "backend2", Model: "m2", Priority: 2},
+				},
+			},
+		},
+	}
+
+	cd := NewCooldownManager()
+	router := NewRouter(cd)
+
+	routes, _ := router.Resolve(cfg, "model-a")
+	if len(routes) != 2 || routes[0].BackendName != "backend1" {
+		t.Fatalf("Expected backend1 first, got %v", routes)
+	}
+
+	cfg = &Config{
+		Backends: cfg.Backends,
+		Models: map[string]*ModelAlias{
+			"model-a": {
+				Routes: []ModelRoute{
+					{Backend: "backend1", Model: "m1", Priority: 2},
+					{Backend: "backend2", Model: "m2", Priority: 1},
+				},
+			},
+		},
+	}
+
+	routes, _ = router.Resolve(cfg, "model-a")
+	if len(routes) != 2 || routes[0].BackendName != "backend2" {
+		t.Errorf("Expected backend2 first after reload, got %v", routes)
+	}
+}
+
 func TestRouter_Resolve_MissingBackend(t *testing.T) {
 	cfg := &Config{
 		Backends: []Backend{
@@ -345,11 +369,10 @@ func TestRouter_Resolve_MissingBackend(t *testing.T) {
 		},
 	}
 
-	cm := newTestConfigManager(cfg)
 	cd := NewCooldownManager()
-	router := NewRouter(cm, cd)
+	router := NewRouter(cd)
 
-	routes, _ := router.Resolve("model-a")
+	routes, _ := router.Resolve(cfg, "model-a")
 	if len(routes) != 1 {
 		t.Fatalf("Expected 1 route (missing backend skipped), got %d", len(routes))
 	}